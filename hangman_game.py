@@ -5,7 +5,7 @@ Tkinter app to play it. Written to satisfy flake8 and pylint defaults.
 """
 
 from dataclasses import dataclass, field
-from typing import Callable, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import random
 import time
 import tkinter as tk
@@ -14,6 +14,23 @@ import tkinter as tk
 # =============================== logic ===============================
 
 
+# Secrets longer than this are masked with str.translate; for short words
+# building the table costs more than the per-character loop it replaces.
+TRANSLATE_MIN_LEN = 16
+
+# (is_alpha, lowercase) for every ASCII code point, so masking the usual
+# ASCII secrets is a tuple lookup rather than two str method calls.
+_ASCII_INFO = tuple((chr(i).isalpha(), chr(i).lower()) for i in range(128))
+
+
+def _spaced(text: str) -> str:
+    """Space out *text* like mask_text does; a space is an empty token."""
+    if "\0" in text:
+        return " ".join("" if ch == " " else ch for ch in text)
+    # "\0" stands in for word breaks so the join can run over the str
+    return " ".join(text.replace(" ", "\0")).replace("\0", "")
+
+
 def mask_text(secret: str, guessed: Optional[Set[str]] = None) -> str:
     """
     Return a masked view of *secret*, revealing only letters in *guessed*.
@@ -25,42 +42,108 @@ def mask_text(secret: str, guessed: Optional[Set[str]] = None) -> str:
     Example:
         "Hello World!" -> "_ _ _ _ _  _ _ _ _ _ !"
     """
-    guessed = {c.lower() for c in (guessed or set())}
-
-    def token(ch: str) -> str:
+    guessed = {c.lower() for c in (guessed or ())}
+    if len(secret) > TRANSLATE_MIN_LEN:
+        table = {
+            ord(ch): "_"
+            for ch in set(secret)
+            if ch.isalpha() and ch.lower() not in guessed
+        }
+        return _spaced(secret.translate(table))
+    tokens = []
+    for ch in secret:
+        code = ord(ch)
+        if code < 128:
+            is_alpha, lower = _ASCII_INFO[code]
+        else:
+            is_alpha, lower = ch.isalpha(), ch.lower()
         if ch == " ":
-            # keep word breaks; returning "" makes join add spaces around it
-            return ""
-        if not ch.isalpha():
-            return ch
-        return ch if ch.lower() in guessed else "_"
+            # keep word breaks; "" makes the join add spaces around it
+            tokens.append("")
+        elif not is_alpha or lower in guessed:
+            tokens.append(ch)
+        else:
+            tokens.append("_")
+    return " ".join(tokens)
 
-    return " ".join(token(ch) for ch in secret)
 
+@dataclass(slots=True)
+class Game:  # pylint: disable=too-many-instance-attributes
+    """Basic Hangman game (no timer).
 
-@dataclass
-class Game:
-    """Basic Hangman game (no timer)."""
+    Guessed letters are kept as a bitmask with one bit per distinct
+    (lowercase) letter of the secret; ``guessed`` decodes it on demand.
+    """
 
     secret: str
     lives: int = 6
-    guessed: Set[str] = field(default_factory=set)
+    _display: List[str] = field(init=False, repr=False, compare=False)
+    _positions: Dict[str, List[Tuple[int, str]]] = field(
+        init=False, repr=False, compare=False
+    )
+    _masked: str = field(init=False, repr=False, compare=False)
+    _letter_bits: Dict[str, int] = field(
+        init=False, repr=False, compare=False
+    )
+    _secret_mask: int = field(init=False, repr=False, compare=False)
+    # compared so that games at different stages are not equal
+    _guessed_mask: int = field(init=False, repr=False)
+    _win: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the secret's letters so guesses are O(1) lookups."""
+        # One pass builds the masked view (as mask_text would) and records
+        # where each letter sits in it, so a hit patches only those slots.
+        self._display = []
+        self._positions = {}
+        for i, ch in enumerate(self.secret):
+            if i:
+                self._display.append(" ")
+            if ch.isalpha():
+                self._positions.setdefault(ch.lower(), []).append(
+                    (len(self._display), ch)
+                )
+                self._display.append("_")
+            elif ch != " ":
+                self._display.append(ch)
+        self._masked = "".join(self._display)
+
+        letters = sorted(self._positions)
+        self._letter_bits = {ch: 1 << i for i, ch in enumerate(letters)}
+        self._secret_mask = (1 << len(letters)) - 1
+        self._guessed_mask = 0
+        self._win = not self._secret_mask
+
+    def __repr__(self) -> str:
+        """Show the public state, with progress decoded as ``guessed``."""
+        return (
+            f"{type(self).__name__}(secret={self.secret!r}, "
+            f"lives={self.lives!r}, guessed={self.guessed!r})"
+        )
+
+    @property
+    def guessed(self) -> Set[str]:
+        """Lowercase letters guessed correctly so far (a fresh set)."""
+        return {
+            ch
+            for ch, bit in self._letter_bits.items()
+            if self._guessed_mask & bit
+        }
 
     @property
     def masked(self) -> str:
         """Masked version of the secret using current guesses."""
-        return mask_text(self.secret, self.guessed)
+        return self._masked
 
     @property
     def won(self) -> bool:
         """True if all letters in the secret have been guessed."""
-        letters = {c.lower() for c in self.secret if c.isalpha()}
-        return letters.issubset({c.lower() for c in self.guessed})
+        return self._win
 
     @property
     def lost(self) -> bool:
         """True if no lives remain and the game has not been won."""
-        return self.lives <= 0 and not self.won
+        return self.lives <= 0 and not self._win
 
     def guess(self, raw: str) -> str:
         """Apply one letter guess; returns: 'hit'|'miss'|'repeat'|'invalid'."""
@@ -68,21 +151,29 @@ class Game:
             return "invalid"
 
         ch = raw.lower()
+        bit = self._letter_bits.get(ch)
 
-        if ch in {c.lower() for c in self.guessed}:
-            return "repeat"
+        if bit is None:
+            self.lives -= 1
+            return "miss"
 
-        if ch in {c.lower() for c in self.secret if c.isalpha()}:
-            self.guessed.add(ch)
-            return "hit"
+        if self._guessed_mask & bit:
+            return "repeat"
 
-        self.lives -= 1
-        return "miss"
+        self._guessed_mask |= bit
+        # only the secret's letters have bits, so equality means all found
+        self._win = self._guessed_mask == self._secret_mask
+        for offset, original in self._positions[ch]:
+            self._display[offset] = original
+        self._masked = "".join(self._display)
+        return "hit"
 
 
 class GameWithTimer(Game):
     """Hangman that deducts a life when the per-turn deadline is exceeded."""
 
+    __slots__ = ("seconds_per_turn", "_clock", "_deadline")
+
     def __init__(
         self,
         secret: str,
@@ -96,7 +187,25 @@ class GameWithTimer(Game):
         self._clock = clock or time.monotonic
         self._deadline = self._clock() + self.seconds_per_turn
 
-    def _apply_timeout_if_needed(self, now: float) -> bool:
+    def guess(self, raw: str) -> str:
+        """Apply a guess, accounting for timeouts before the guess.
+
+        A timeout consumes a life and ignores the input; a hit or miss
+        starts a fresh turn.
+        """
+        now = self._clock()
+        if self._expire(now):
+            return "timeout"
+        res = super().guess(raw)
+        if res in ("hit", "miss"):
+            self._deadline = now + self.seconds_per_turn
+        return res
+
+    def check_timeout(self) -> bool:
+        """Consume a life if the turn deadline passed; True if it did."""
+        return self._expire(self._clock())
+
+    def _expire(self, now: float) -> bool:
         """If the deadline passed, consume a life and extend the deadline."""
         if now > self._deadline:
             self.lives -= 1
@@ -104,45 +213,55 @@ class GameWithTimer(Game):
             return True
         return False
 
-    def guess(self, raw: str) -> str:
-        """Apply a guess, accounting for timeouts before the guess."""
-        now = self._clock()
-        if self._apply_timeout_if_needed(now):
-            return "timeout"
-        return super().guess(raw)
-
     def now(self) -> float:
         """Public wrapper for the injected clock (avoids protected access)."""
         return self._clock()
 
+    def seconds_left(self) -> float:
+        """Seconds until the current turn expires (negative once it has)."""
+        return self._deadline - self._clock()
+
 
 # ================================ UI =================================
 
 
-BASIC_WORDS = [
+BASIC_WORDS = (
     "python",
     "testing",
     "variable",
     "function",
     "quality",
     "packet",
-]
+)
 
-PHRASES = [
+PHRASES = (
     "unit testing",
     "software quality",
     "clean code",
     "open source",
-]
+)
+
+_SECRETS = {"basic": BASIC_WORDS, "intermediate": PHRASES}
+
+# Dedicated generator (seed it for reproducible picks) with a bound choice.
+_rand = random.Random()
+_choice = _rand.choice
 
 SECONDS_PER_TURN = 15
 START_LIVES = 6
 
+_RESULT_MSG = {
+    "timeout": "Time's up! A life was lost.",
+    "hit": "Correct guess.",
+    "miss": "Wrong guess.",
+    "repeat": "Already guessed.",
+    "invalid": "Enter one A–Z letter.",
+}
+
 
 def choose_secret(level: str) -> str:
     """Pick a secret word/phrase according to the selected *level*."""
-    words = PHRASES if level == "intermediate" else BASIC_WORDS
-    return random.choice(words)
+    return _choice(_SECRETS[level] if level in _SECRETS else BASIC_WORDS)
 
 
 # pylint: disable=too-many-instance-attributes
@@ -186,9 +305,10 @@ class HangmanApp(tk.Tk):
             bg="#FFF8E7",
         ).pack(side=tk.LEFT, padx=6)
 
+        # filled from the game's cached masked view once a round starts
         self.lbl_word = tk.Label(
             body,
-            text="_ _ _ _ _",
+            text="",
             font=("Consolas", 26, "bold"),
             bg="#FFF8E7",
         )
@@ -261,7 +381,11 @@ class HangmanApp(tk.Tk):
         self.result_banner.pack(pady=(2, 0), anchor="w")
 
         self.g: Optional[GameWithTimer] = None
-        self._tick_job: Optional[str] = None
+        self._timeout_job: Optional[str] = None
+        self._timer_job: Optional[str] = None
+        self._last_masked: Optional[str] = None
+        self._last_lives: Optional[int] = None
+        self.bind("<Destroy>", self._on_destroy)
 
     # ------------------------- game control -------------------------
 
@@ -276,42 +400,63 @@ class HangmanApp(tk.Tk):
         self.var_msg.set("Game started. Guess one letter.")
         self.result_banner.config(text="", fg="#000000")
         self._refresh_board()
-        self._start_ticker()
+        self._start_timers()
         self.entry.config(state="normal")
         self.btn_submit.config(state="normal")
         self.entry.focus()
 
-    def _start_ticker(self) -> None:
-        """Start or restart the periodic timer update."""
-        if self._tick_job:
-            self.after_cancel(self._tick_job)
-            self._tick_job = None
-        self._tick()
+    def _start_timers(self) -> None:
+        """Arm the turn timeout and restart the countdown label."""
+        self._schedule_timeout()
+        self._refresh_timer_label()
+
+    def _cancel_timers(self) -> None:
+        """Cancel any pending timeout and countdown callbacks."""
+        for job in (self._timeout_job, self._timer_job):
+            if job:
+                self.after_cancel(job)
+        self._timeout_job = None
+        self._timer_job = None
 
     def _remaining(self) -> int:
         """Seconds remaining on the current turn."""
         if not self.g:
             return 0
-        deadline = getattr(self.g, "_deadline", 0)
-        return int(max(0, deadline - self.g.now()))
-
-    def _tick(self) -> None:
-        """Update the time label and process timeouts."""
-        if self.g:
-            remain = self._remaining()
-            self.var_time.set(f"Time left: {remain}s")
-            if remain <= 0:
-                res = self.g.guess("")  # timeout path
-                if res == "timeout":
-                    msg_timeout = "Time's up! A life was lost."
-                    self.var_msg.set(msg_timeout)
-                    self._refresh_board()
-        self._tick_job = self.after(250, self._tick)
+        return int(max(0, self.g.seconds_left()))
+
+    def _schedule_timeout(self) -> None:
+        """Schedule one callback for the moment the current turn expires."""
+        if self._timeout_job:
+            self.after_cancel(self._timeout_job)
+        # +1 ms so the callback lands after the deadline, not on it
+        ms = int(self.g.seconds_left() * 1000) + 1
+        self._timeout_job = self.after(max(ms, 0), self._on_timeout)
+
+    def _refresh_timer_label(self) -> None:
+        """Update the countdown label, then again in one second."""
+        if self._timer_job:
+            self.after_cancel(self._timer_job)
+        self.var_time.set(f"Time left: {self._remaining()}s")
+        self._timer_job = self.after(1000, self._refresh_timer_label)
+
+    def _on_timeout(self) -> None:
+        """Process an expired turn and arm the timeout for the next one."""
+        self._timeout_job = None
+        if self.g.check_timeout():
+            self.var_msg.set(_RESULT_MSG["timeout"])
+            self._refresh_board()
+        if not (self.g.won or self.g.lost):
+            self._start_timers()
 
     def _refresh_board(self) -> None:
         """Refresh masked word, lives, and win/lose banners."""
-        self.lbl_word.config(text=self.g.masked)
-        self.var_lives.set(f"Lives: {self.g.lives}")
+        # skip Tk writes for values that did not change since last time
+        if self.g.masked != self._last_masked:
+            self._last_masked = self.g.masked
+            self.lbl_word.config(text=self._last_masked)
+        if self.g.lives != self._last_lives:
+            self._last_lives = self.g.lives
+            self.var_lives.set(f"Lives: {self._last_lives}")
 
         if self.g.won:
             self._end_with_banner(
@@ -326,6 +471,7 @@ class HangmanApp(tk.Tk):
 
     def _end_with_banner(self, text: str, color: str) -> None:
         """Show result banner and disable input until 'New' is pressed."""
+        self._cancel_timers()
         self.result_banner.config(text=text, fg=color)
         self.var_msg.set("Press New to start another round.")
         self.entry.config(state="disabled")
@@ -343,15 +489,15 @@ class HangmanApp(tk.Tk):
         self.entry.delete(0, tk.END)
 
         res = self.g.guess(raw)
-        mapping = {
-            "timeout": "Time's up! A life was lost.",
-            "hit": "Correct guess.",
-            "miss": "Wrong guess.",
-            "repeat": "Already guessed.",
-            "invalid": "Enter one A–Z letter.",
-        }
-        self.var_msg.set(mapping.get(res, res))
+        self.var_msg.set(_RESULT_MSG.get(res, res))
         self._refresh_board()
+        if not (self.g.won or self.g.lost):
+            self._start_timers()
+
+    def _on_destroy(self, evt: tk.Event) -> None:
+        """Stop pending timer callbacks once the main window goes away."""
+        if evt.widget is self:
+            self._cancel_timers()
 
 
 # ============================== launcher ==============================
@@ -1,5 +1,7 @@
 """Unit tests for hangman_game (logic + timer)."""
 
+import pytest
+
 import hangman_game as game
 
 
@@ -8,9 +10,26 @@ def test_mask_text_masks_letters_only() -> None:
     assert game.mask_text("Hello World!") == "_ _ _ _ _  _ _ _ _ _ !"
 
 
+def test_mask_text_long_phrase_keeps_guessed_letters() -> None:
+    """Long phrases reveal guessed letters in either case."""
+    phrase = "Software quality, Open source!"
+    assert len(phrase) > game.TRANSLATE_MIN_LEN
+    assert game.mask_text(phrase, {"o", "S"}) == (
+        "S o _ _ _ _ _ _  _ _ _ _ _ _ _ ,  O _ _ _  s o _ _ _ _ !"
+    )
+
+
+def test_choose_secret_falls_back_to_basic_words() -> None:
+    """Unknown levels pick from the basic word list."""
+    assert game.choose_secret("intermediate") in game.PHRASES
+    assert game.choose_secret("expert") in game.BASIC_WORDS
+
+
 class FakeClock:
     """Tiny controllable clock for deterministic timer tests."""
 
+    __slots__ = ("t",)
+
     def __init__(self) -> None:
         self.t = 0.0
 
@@ -30,18 +49,63 @@ def test_initial_state() -> None:
     assert (not g.won) and (not g.lost)
 
 
-def test_correct_guess_reveals_all_positions() -> None:
-    """A correct guess reveals all matching letters."""
-    g = game.Game("banana", lives=3)
-    assert g.guess("a") == "hit"
-    assert g.masked == "_ a _ a _ a"
+@pytest.mark.parametrize(
+    "secret,lives,letter,expected",
+    [
+        # a correct guess reveals all matching letters
+        ("banana", 3, "a", ("hit", 3, "_ a _ a _ a")),
+        # a wrong guess decrements lives by one
+        ("hi", 2, "z", ("miss", 1, "_ _")),
+        ("x", 1, "z", ("miss", 0, "_")),
+    ],
+)
+def test_single_guess_outcome(
+    secret: str, lives: int, letter: str, expected: tuple
+) -> None:
+    """One guess yields the expected (result, lives, masked word)."""
+    g = game.Game(secret, lives=lives)
+    assert (g.guess(letter), g.lives, g.masked) == expected
+
+
+@pytest.mark.parametrize(
+    "secret,letter,before,after",
+    [
+        # spaces become a double gap; every occurrence is revealed
+        (
+            "Unit testing",
+            "t",
+            "_ _ _ _  _ _ _ _ _ _ _",
+            "_ _ _ t  t _ _ t _ _ _",
+        ),
+        # a lowercase guess reveals the letter in its original case
+        ("Go", "g", "_ _", "G _"),
+    ],
+)
+def test_hit_keeps_layout_and_case(
+    secret: str, letter: str, before: str, after: str
+) -> None:
+    """A hit reveals letters in place, keeping spacing and case."""
+    g = game.Game(secret)
+    assert g.masked == before
+    assert g.guess(letter) == "hit"
+    assert g.masked == after == game.mask_text(secret, {letter})
+
+
+def test_guessed_lists_correct_letters_lowercased() -> None:
+    """Only correct guesses are recorded, normalised to lowercase."""
+    g = game.Game("Go", lives=3)
+    g.guess("G")
+    g.guess("z")
+    assert g.guessed == {"g"}
 
 
-def test_wrong_guess_costs_one_life() -> None:
-    """A wrong guess decrements lives by one."""
-    g = game.Game("hi", lives=2)
-    assert g.guess("z") == "miss"
-    assert g.lives == 1
+def test_equality_and_repr_reflect_progress() -> None:
+    """Games differ once one has a correct guess the other lacks."""
+    g = game.Game("ab", lives=3)
+    assert g == game.Game("ab", lives=3)
+    g.guess("a")
+    assert g != game.Game("ab", lives=3)
+    assert repr(g) == "Game(secret='ab', lives=3, guessed={'a'})"
 
 
 def test_win_when_all_letters_revealed() -> None:
@@ -82,3 +146,42 @@ def test_deadline_resets_after_timeout() -> None:
     clk.advance(10)
     assert g.guess("a") == "hit"  # within the new window
     assert g.masked == "a _ _"
+
+
+def test_seconds_left_counts_down_the_turn() -> None:
+    """seconds_left reports the time until the turn deadline."""
+    clk = FakeClock()
+    g = game.GameWithTimer(
+        "abc", lives=2, seconds_per_turn=15, clock=clk
+    )
+    clk.advance(4)
+    assert g.seconds_left() == 11
+    clk.advance(13)
+    assert g.seconds_left() == -2
+
+
+def test_deadline_resets_after_scored_guess() -> None:
+    """A hit or miss starts a new turn with a full time allowance."""
+    clk = FakeClock()
+    g = game.GameWithTimer(
+        "abc", lives=2, seconds_per_turn=15, clock=clk
+    )
+    clk.advance(10)
+    assert g.guess("a") == "hit"
+    clk.advance(10)  # 20s since start, but only 10s into this turn
+    assert g.guess("z") == "miss"
+    assert g.lives == 1
+
+
+def test_check_timeout_only_fires_after_deadline() -> None:
+    """check_timeout costs a life only once the turn has expired."""
+    clk = FakeClock()
+    g = game.GameWithTimer(
+        "abc", lives=2, seconds_per_turn=15, clock=clk
+    )
+    clk.advance(15)
+    assert not g.check_timeout()
+    clk.advance(1)
+    assert g.check_timeout()
+    assert g.lives == 1
+    assert not g.check_timeout()  # deadline was reset